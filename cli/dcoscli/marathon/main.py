@@ -1,14 +1,15 @@
-import json
+import concurrent.futures
 import os
+import re
 import sys
 import time
 
 import docopt
-import pkg_resources
 import six
 
 import dcoscli
-from dcos import cmds, emitting, http, jsonitem, marathon, options, util
+from dcos import (cmds, config, emitting, http, jsonitem, marathon, options,
+                  util)
 from dcos.errors import DCOSException
 from dcoscli import tables
 from dcoscli.subcommand import default_command_info, default_doc
@@ -271,9 +272,7 @@ class ResourceReader(object):
                     http.silence_requests_warnings()
                     req = http.get(name)
                     if req.status_code == 200:
-                        data = b''
-                        for chunk in req.iter_content(1024):
-                            data += chunk
+                        data = b''.join(req.iter_content(1024))
                         return util.load_jsons(data.decode('utf-8'))
                     else:
                         raise Exception
@@ -302,18 +301,21 @@ class ResourceReader(object):
                 "E.g. dcos marathon app update your-app-id < app_update.json"
             ResourceReader._assert_no_tty(example)
 
-            return util.load_jsons(sys.stdin.read())
+            return util.load_json(sys.stdin)
 
-        resource_json = {}
+        # Reject repeated keys before paying for parsing any of the values
+        keys = set()
         for prop in properties:
-            key, value = jsonitem.parse_json_item(prop, None)
-
-            key = jsonitem.clean_value(key)
-            if key in resource_json:
+            key = prop.partition('=')[0]
+            if key in keys:
                 raise DCOSException(
                     'Key {!r} was specified more than once'.format(key))
+            keys.add(key)
 
-            resource_json[key] = value
+        resource_json = {}
+        for prop in properties:
+            key, value = jsonitem.parse_json_item(prop, None)
+            resource_json[jsonitem.clean_value(key)] = value
         return resource_json
 
     @staticmethod
@@ -390,13 +392,14 @@ class MarathonSubcommand(object):
         """
 
         client = self._create_marathon_client()
-        apps = client.get_apps()
 
         if json_:
-            emitter.publish(apps)
+            emitter.publish(client.get_apps())
         else:
-            deployments = client.get_deployments()
-            queued_apps = client.get_queued_apps()
+            apps, deployments, queued_apps = _call_concurrently(
+                client.get_apps,
+                client.get_deployments,
+                client.get_queued_apps)
             _enhance_row_with_overdue_information(apps, queued_apps)
             table = tables.app_table(apps, deployments)
             output = six.text_type(table)
@@ -550,6 +553,18 @@ class MarathonSubcommand(object):
         :rtype: int
         """
 
+        # Set instances to 1 if not specified. Validate it before talking to
+        # Marathon so that bad input doesn't cost a round trip.
+        if instances is None:
+            instances = 1
+        else:
+            instances = util.parse_int(instances)
+            if instances <= 0:
+                emitter.publish(
+                    'The number of instances must be positive: {!r}.'.format(
+                        instances))
+                return 1
+
         # Check that the application exists
         client = self._create_marathon_client()
 
@@ -563,20 +578,7 @@ class MarathonSubcommand(object):
             return 1
 
         # Need to add the 'id' because it is required
-        app_json = {'id': app_id}
-
-        # Set instances to 1 if not specified
-        if instances is None:
-            instances = 1
-        else:
-            instances = util.parse_int(instances)
-            if instances <= 0:
-                emitter.publish(
-                    'The number of instances must be positive: {!r}.'.format(
-                        instances))
-                return 1
-
-        app_json['instances'] = instances
+        app_json = {'id': app_id, 'instances': instances}
 
         deployment = client.update_app(app_id, app_json, force)
 
@@ -612,6 +614,7 @@ class MarathonSubcommand(object):
         deployment = client.update_app(app_id, app_json, force)
 
         emitter.publish('Created deployment {}'.format(deployment))
+        return 0
 
     def update(self, app_id, properties, force):
         """
@@ -627,7 +630,8 @@ class MarathonSubcommand(object):
 
         client = self._create_marathon_client()
 
-        # Ensure that the application exists
+        # Ensure that the application exists. This can't be left to
+        # update_app: Marathon's PUT creates the app if it is missing.
         client.get_app(app_id)
 
         resource = self._resource_reader.\
@@ -920,8 +924,9 @@ class MarathonSubcommand(object):
         marathon_client = self._create_marathon_client()
         self._ensure_pods_support(marathon_client)
 
-        pods = marathon_client.list_pod()
-        queued_apps = marathon_client.get_queued_apps()
+        pods, queued_apps = _call_concurrently(
+            marathon_client.list_pod,
+            marathon_client.get_queued_apps)
         _enhance_row_with_overdue_information(pods, queued_apps)
         emitting.publish_table(emitter, pods, tables.pod_table, json_)
         return 0
@@ -1062,6 +1067,21 @@ class MarathonSubcommand(object):
             raise DCOSException(msg)
 
 
+def _call_concurrently(*fns):
+    """Calls each of the functions on its own thread. Use this for
+    independent Marathon requests so that their round trips overlap.
+
+    :param fns: functions that take no arguments
+    :type fns: [function]
+    :returns: the return value of each function, in order
+    :rtype: list
+    """
+
+    with concurrent.futures.ThreadPoolExecutor(len(fns)) as pool:
+        futures = [pool.submit(fn) for fn in fns]
+        return [future.result() for future in futures]
+
+
 def _enhance_row_with_overdue_information(rows, queued_apps):
     """Calculates if configured `backoff` duration for this
     app or pod definition was exceeded. In that case this application
@@ -1099,29 +1119,28 @@ def _calculate_version(client, app_id, version):
     :rtype: str
     """
 
-    # First let's try to parse it as a negative integer
-    try:
-        value = util.parse_int(version)
-    except DCOSException:
-        logger.exception('Unable to parse version %s', version)
+    # Anything that doesn't look like an integer is an absolute version.
+    # Checking this up front avoids a failed int parse for every date-time.
+    if not re.match(r'^[+-]?\d+$', version.strip()):
         return version
-    else:
-        if value < 0:
-            value = -1 * value
-            # We have a negative value let's ask Marathon for the last
-            # abs(value)
-            versions = client.get_app_versions(app_id, value + 1)
-
-            if len(versions) <= value:
-                # We don't have enough versions. Return an error.
-                msg = "Application {!r} only has {!r} version(s)."
-                raise DCOSException(msg.format(app_id, len(versions), value))
-            else:
-                return versions[value]
 
+    value = util.parse_int(version)
+    if value < 0:
+        value = -1 * value
+        # We have a negative value let's ask Marathon for the last
+        # abs(value)
+        versions = client.get_app_versions(app_id, value + 1)
+
+        if len(versions) <= value:
+            # We don't have enough versions. Return an error.
+            msg = "Application {!r} only has {!r} version(s)."
+            raise DCOSException(msg.format(app_id, len(versions), value))
         else:
-            raise DCOSException(
-                'Relative versions must be negative: {}'.format(version))
+            return versions[value]
+
+    else:
+        raise DCOSException(
+            'Relative versions must be negative: {}'.format(version))
 
 
 def _cli_config_schema():
@@ -1129,7 +1148,4 @@ def _cli_config_schema():
     :returns: schema for marathon cli config
     :rtype: dict
     """
-    return json.loads(
-        pkg_resources.resource_string(
-            'dcos',
-            'data/config-schema/marathon.json').decode('utf-8'))
+    return config.get_config_schema('marathon')
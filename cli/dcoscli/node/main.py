@@ -212,11 +212,12 @@ def _bundle_manage(list_bundles, status, cancel, json):
         if not available_bundles:
             emitter.publish("No available diagnostic bundles")
             return 0
-        emitter.publish("Available diagnostic bundles:")
+        lines = ["Available diagnostic bundles:"]
         for available_bundle in sorted(available_bundles,
                                        key=lambda t: t[0]):
-            emitter.publish('{} {}'.format(available_bundle[0],
-                                           sizeof_fmt(available_bundle[1])))
+            lines.append('{} {}'.format(available_bundle[0],
+                                        sizeof_fmt(available_bundle[1])))
+        emitter.publish('\n'.join(lines))
         return 0
     elif status:
         url = urllib.parse.urljoin(DIAGNOSTICS_BASE_URL, 'status/all')
@@ -605,9 +606,9 @@ def print_components(ip, use_json):
 
     if use_json:
         emitter.publish(response['units'])
-    else:
-        for component in response['units']:
-            emitter.publish(component['id'])
+    elif response['units']:
+        emitter.publish(
+            '\n'.join(component['id'] for component in response['units']))
 
 
 def _get_unit_type(unit_name):
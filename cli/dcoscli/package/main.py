@@ -1,9 +1,7 @@
-import json
 import os
 import sys
 
 import docopt
-import pkg_resources
 
 import dcoscli
 from dcos import (cmds, config, cosmospackage, emitting, http, options,
@@ -108,10 +106,7 @@ def _package(config_schema, info):
     :rtype: int
     """
     if config_schema:
-        schema = json.loads(
-            pkg_resources.resource_string(
-                'dcos',
-                'data/config-schema/package.json').decode('utf-8'))
+        schema = config.get_config_schema('package')
         emitter.publish(schema)
     elif info:
         _info()
@@ -1,3 +1,4 @@
+import functools
 import traceback
 
 import pkg_resources
@@ -34,8 +35,10 @@ def _default_modules():
             }
 
 
+@functools.lru_cache(maxsize=None)
 def default_doc(command):
-    """Returns documentation of command
+    """Returns documentation of command. The packaged help text never changes
+    so it is only read once per process.
 
     :param command: default DC/OS CLI command
     :type command: str
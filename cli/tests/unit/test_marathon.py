@@ -0,0 +1,186 @@
+import io
+
+import pytest
+from mock import create_autospec, patch
+
+import dcoscli.marathon.main as main
+from dcos import marathon
+from dcos.errors import DCOSException
+
+
+@patch('dcoscli.marathon.main.emitter', autospec=True)
+def test_app_start_invoked_successfully(emitter):
+    subcmd, marathon_client = _failing_reader_fixture()
+    marathon_client.get_app.return_value = {'id': '/foo', 'instances': 0}
+    marathon_client.update_app.return_value = 'a-deployment-id'
+
+    returncode = subcmd.start('foo', '3', force=False)
+
+    assert returncode == 0
+    marathon_client.get_app.assert_called_with('foo')
+    marathon_client.update_app.assert_called_with(
+        'foo', {'id': 'foo', 'instances': 3}, False)
+    emitter.publish.assert_called_with('Created deployment a-deployment-id')
+
+
+@patch('dcoscli.marathon.main.emitter', autospec=True)
+def test_app_start_rejects_non_positive_instances_without_http(emitter):
+    subcmd, marathon_client = _failing_reader_fixture()
+
+    assert subcmd.start('foo', '0', force=False) == 1
+    assert not marathon_client.get_app.called
+    assert not marathon_client.update_app.called
+
+    with pytest.raises(DCOSException):
+        subcmd.start('foo', 'not-a-number', force=False)
+    assert not marathon_client.get_app.called
+
+
+@patch('dcoscli.marathon.main.emitter', autospec=True)
+def test_app_start_already_started(emitter):
+    subcmd, marathon_client = _failing_reader_fixture()
+    marathon_client.get_app.return_value = {'id': '/foo', 'instances': 2}
+
+    assert subcmd.start('foo', None, force=False) == 1
+    assert not marathon_client.update_app.called
+
+
+@patch('dcoscli.marathon.main.sys')
+def test_resource_from_properties_reads_stdin(sys_module):
+    sys_module.stdin = io.StringIO('{"instances": 2, "cmd": "sleep 1"}')
+    sys_module.stdin.isatty = lambda: False
+
+    resource = main.ResourceReader.get_resource_from_properties([])
+
+    assert resource == {'instances': 2, 'cmd': 'sleep 1'}
+
+
+@patch('dcoscli.marathon.main.emitter', autospec=True)
+def test_app_stop_invoked_successfully(emitter):
+    subcmd, marathon_client = _failing_reader_fixture()
+    marathon_client.get_app.return_value = {'id': '/foo', 'instances': 3}
+    marathon_client.update_app.return_value = 'a-deployment-id'
+
+    assert subcmd.stop('foo', force=True) == 0
+    marathon_client.update_app.assert_called_with(
+        'foo', {'instances': 0}, True)
+    emitter.publish.assert_called_with('Created deployment a-deployment-id')
+
+
+@patch('dcoscli.marathon.main.emitter', autospec=True)
+def test_app_stop_already_stopped(emitter):
+    subcmd, marathon_client = _failing_reader_fixture()
+    marathon_client.get_app.return_value = {'id': '/foo', 'instances': 0}
+
+    assert subcmd.stop('foo', force=False) == 1
+    assert not marathon_client.update_app.called
+
+
+@patch('dcoscli.marathon.main.emitter', autospec=True)
+def test_app_list_with_json(emitter):
+    subcmd, marathon_client = _failing_reader_fixture()
+    marathon_client.get_apps.return_value = [{'id': '/foo'}]
+
+    assert subcmd.list(json_=True) == 0
+    emitter.publish.assert_called_with([{'id': '/foo'}])
+    assert not marathon_client.get_deployments.called
+    assert not marathon_client.get_queued_apps.called
+
+
+@patch('dcoscli.marathon.main.tables.app_table', return_value='a-table')
+@patch('dcoscli.marathon.main.emitter', autospec=True)
+def test_app_list_table(emitter, app_table):
+    subcmd, marathon_client = _failing_reader_fixture()
+    marathon_client.get_apps.return_value = [{'id': '/foo'}, {'id': '/bar'}]
+    marathon_client.get_deployments.return_value = [{'id': 'deployment'}]
+    marathon_client.get_queued_apps.return_value = [
+        {'app': {'id': '/bar'}, 'delay': {'overdue': True}}]
+
+    assert subcmd.list(json_=False) == 0
+
+    app_table.assert_called_once_with(
+        [{'id': '/foo', 'overdue': False}, {'id': '/bar', 'overdue': True}],
+        [{'id': 'deployment'}])
+    emitter.publish.assert_called_with('a-table')
+
+
+def test_app_list_propagates_exceptions():
+    subcmd, marathon_client = _failing_reader_fixture()
+    marathon_client.get_apps.return_value = []
+    marathon_client.get_deployments.side_effect = DCOSException('BOOM!')
+
+    with pytest.raises(DCOSException) as exception_info:
+        subcmd.list(json_=False)
+
+    assert str(exception_info.value) == 'BOOM!'
+
+
+def test_resource_from_properties():
+    resource = main.ResourceReader.get_resource_from_properties(
+        ['instances=2', 'cmd="sleep 100"', 'env={"FOO": "bar"}'])
+
+    assert resource == {
+        'instances': 2, 'cmd': 'sleep 100', 'env': {'FOO': 'bar'}}
+
+
+def test_resource_from_properties_rejects_duplicate_keys():
+    with pytest.raises(DCOSException) as exception_info:
+        main.ResourceReader.get_resource_from_properties(
+            ['cpus=1', 'mem=32', 'mem=64', 'cpus=2'])
+
+    expected = "Key 'mem' was specified more than once"
+    assert str(exception_info.value) == expected
+
+
+@patch('dcos.jsonitem.parse_json_item')
+def test_resource_from_properties_checks_duplicates_before_parsing(parse):
+    with pytest.raises(DCOSException):
+        main.ResourceReader.get_resource_from_properties(
+            ['env={"A": "1"}', 'env={"B": "2"}'])
+
+    assert not parse.called
+
+
+def test_calculate_version_absolute():
+    marathon_client = create_autospec(marathon.Client)
+    for version in ['2016-03-09T21:32:00.000Z', '--3', '\u00b2']:
+        assert main._calculate_version(
+            marathon_client, 'foo', version) == version
+    assert not marathon_client.get_app_versions.called
+
+
+def test_calculate_version_relative():
+    marathon_client = create_autospec(marathon.Client)
+    marathon_client.get_app_versions.return_value = ['v3', 'v2', 'v1']
+
+    assert main._calculate_version(marathon_client, 'foo', '-2') == 'v1'
+    marathon_client.get_app_versions.assert_called_with('foo', 3)
+
+    for version in ['-2 ', ' -2']:
+        assert main._calculate_version(
+            marathon_client, 'foo', version) == 'v1'
+
+    for version in ['-3', '-3 ']:
+        with pytest.raises(DCOSException) as exception_info:
+            main._calculate_version(marathon_client, 'foo', version)
+        assert 'only has 3 version(s)' in str(exception_info.value)
+
+    with pytest.raises(DCOSException) as exception_info:
+        main._calculate_version(marathon_client, 'foo', '2')
+    assert 'Relative versions must be negative' in str(exception_info.value)
+
+
+def _failing_reader_fixture():
+    marathon_client = create_autospec(marathon.Client)
+    subcmd = main.MarathonSubcommand(_failing_resource_reader(),
+                                     lambda: marathon_client)
+
+    return subcmd, marathon_client
+
+
+def _failing_resource_reader():
+    resource_reader = create_autospec(main.ResourceReader)
+    error = AssertionError("should not be called")
+    resource_reader.get_resource.side_effect = error
+    resource_reader.get_resource_from_properties.side_effect = error
+    return resource_reader
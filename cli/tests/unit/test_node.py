@@ -274,6 +274,30 @@ def test_list_components(mocked_get, mocked_get_slave_ip,
         'http://10.10.10.10/system/health/v1/nodes/127.0.0.1/units')
 
 
+@mock.patch('dcoscli.node.main.emitter')
+@mock.patch('dcos.config.get_config_val')
+@mock.patch('dcos.http.get')
+def test_print_components(mocked_get, mocked_get_config_val, emitter):
+    m = mock.MagicMock()
+    m.json.return_value = {
+        'units': [
+            {'id': 'dcos-adminrouter.service'},
+            {'id': 'dcos-marathon.service'}
+        ]
+    }
+    mocked_get.return_value = m
+    mocked_get_config_val.return_value = 'http://10.10.10.10'
+
+    main.print_components('127.0.0.1', False)
+    emitter.publish.assert_called_once_with(
+        'dcos-adminrouter.service\ndcos-marathon.service')
+
+    emitter.reset_mock()
+    m.json.return_value = {'units': []}
+    main.print_components('127.0.0.1', False)
+    assert not emitter.publish.called
+
+
 @mock.patch('dcos.config.get_config_val')
 @mock.patch('dcos.mesos.MesosDNSClient')
 @mock.patch('dcos.http.get')
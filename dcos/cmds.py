@@ -32,13 +32,9 @@ def execute(cmds, args):
     """
 
     for hierarchy, arg_keys, function in cmds:
-        # Let's find if the function matches the command
-        match = True
-        for positional in hierarchy:
-            if not args[positional]:
-                match = False
-
-        if match:
+        # Let's find if the function matches the command. Stop at the first
+        # noun or verb that isn't set.
+        if all(args[positional] for positional in hierarchy):
             params = [args[name] for name in arg_keys]
             return function(*params)
 
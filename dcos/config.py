@@ -1,8 +1,10 @@
 import collections
 import copy
+import functools
 import json
 import os
 
+import jsonschema
 import pkg_resources
 import toml
 
@@ -19,7 +21,10 @@ def get_config_path():
     :rtype: str
     """
 
-    return os.environ.get(constants.DCOS_CONFIG_ENV, get_default_config_path())
+    path = os.environ.get(constants.DCOS_CONFIG_ENV)
+    if path is None:
+        path = get_default_config_path()
+    return path
 
 
 def get_default_config_path():
@@ -52,7 +57,25 @@ def get_config(mutable=False):
 
     if path == default:
         util.ensure_dir_exists(os.path.dirname(default))
-    return load_from_path(path, mutable)
+
+    if mutable:
+        return load_from_path(path, mutable)
+    else:
+        return _load_cached_from_path(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_cached_from_path(path):
+    """Loads an immutable TOML config from the path, reusing the result of
+    previous loads of the same path. The cache is cleared by `save`.
+
+    :param path: Path to the TOML file
+    :type path: str
+    :returns: Map for the configuration file
+    :rtype: Toml
+    """
+
+    return load_from_path(path)
 
 
 def get_config_val(name, config=None):
@@ -189,6 +212,8 @@ def save(toml_config):
     with util.open_file(path, 'w') as config_file:
         config_file.write(serial)
 
+    _load_cached_from_path.cache_clear()
+
 
 def _get_path(toml_config, path):
     """
@@ -297,21 +322,31 @@ def get_config_schema(command):
     # core.* config variables are special.  They're valid, but don't
     # correspond to any particular subcommand, so we must handle them
     # separately.
-    if command == "core":
-        return json.loads(
-            pkg_resources.resource_string(
-                'dcos',
-                'data/config-schema/core.json').decode('utf-8'))
-    elif command in subcommand.default_subcommands():
-        return json.loads(
-            pkg_resources.resource_string(
-                'dcos',
-                'data/config-schema/{}.json'.format(command)).decode('utf-8'))
+    if command == "core" or command in subcommand.default_subcommands():
+        return _load_packaged_config_schema(command)
     else:
         executable = subcommand.command_executables(command)
         return subcommand.config_schema(executable, command)
 
 
+@functools.lru_cache(maxsize=None)
+def _load_packaged_config_schema(command):
+    """Reads and parses a configuration schema shipped with the dcos
+    package. The result is cached since the packaged schemas never change
+    during the lifetime of the process.
+
+    :param command: the subcommand name, or "core"
+    :type command: str
+    :returns: the parsed configuration schema
+    :rtype: dict
+    """
+
+    return json.loads(
+        pkg_resources.resource_string(
+            'dcos',
+            'data/config-schema/{}.json'.format(command)).decode('utf-8'))
+
+
 def get_property_description(section, subkey):
     """
     :param section: section of config paramater
@@ -343,10 +378,11 @@ def check_config(toml_config_pre, toml_config_post, section):
     :rtype: int
     """
 
-    errors_pre = util.validate_json(toml_config_pre._dictionary[section],
-                                    get_config_schema(section))
-    errors_post = util.validate_json(toml_config_post._dictionary[section],
-                                     get_config_schema(section))
+    validator = jsonschema.Draft4Validator(get_config_schema(section))
+    errors_pre = util.validate_json_with(
+        toml_config_pre._dictionary[section], validator)
+    errors_post = util.validate_json_with(
+        toml_config_post._dictionary[section], validator)
 
     logger.info('Comparing changes in the configuration...')
     logger.info('Errors before the config command: %r', errors_pre)
@@ -1,5 +1,9 @@
+import functools
+import threading
+
 import requests
 from requests.auth import AuthBase
+from six.moves import http_cookiejar
 
 from dcos import config, util
 from dcos.errors import (DCOSAuthenticationException,
@@ -11,6 +15,8 @@ logger = util.get_logger(__name__)
 
 DEFAULT_TIMEOUT = 5
 
+_SESSION_LOCK = threading.Lock()
+
 
 def _default_is_success(status_code):
     """Returns true if the success status is between [200, 300).
@@ -43,6 +49,35 @@ def _verify_ssl(verify=None):
     return verify
 
 
+def _get_session():
+    """Returns the session shared by every request this process sends, so
+    that connections to the same host are kept alive and reused instead of
+    paying for a new TCP and TLS handshake each time. Cookies are never
+    stored, which matches calling `requests.request` directly.
+
+    :returns: the shared HTTP session
+    :rtype: requests.Session
+    """
+
+    # lru_cache doesn't stop concurrent first calls from each creating a
+    # session, so serialize them
+    with _SESSION_LOCK:
+        return _create_session()
+
+
+@functools.lru_cache(maxsize=1)
+def _create_session():
+    """
+    :returns: a new HTTP session that doesn't store cookies
+    :rtype: requests.Session
+    """
+
+    session = requests.Session()
+    session.cookies.set_policy(
+        http_cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
 @util.duration
 def _request(method,
              url,
@@ -87,7 +122,7 @@ def _request(method,
         kwargs.get('headers'))
 
     try:
-        response = requests.request(
+        response = _get_session().request(
             method=method,
             url=url,
             timeout=timeout,
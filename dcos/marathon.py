@@ -21,7 +21,8 @@ def create_client(toml_config=None):
         toml_config = config.get_config()
 
     marathon_url = _get_marathon_url(toml_config)
-    timeout = config.get_config_val('core.timeout') or http.DEFAULT_TIMEOUT
+    timeout = (config.get_config_val('core.timeout', toml_config) or
+               http.DEFAULT_TIMEOUT)
     rpc_client = rpcclient.create_client(marathon_url, timeout)
 
     logger.info('Creating marathon client with: %r', marathon_url)
@@ -23,7 +23,8 @@ def create_client(toml_config=None):
         toml_config = config.get_config()
 
     metronome_url = _get_metronome_url(toml_config)
-    timeout = config.get_config_val('core.timeout') or http.DEFAULT_TIMEOUT
+    timeout = (config.get_config_val('core.timeout', toml_config) or
+               http.DEFAULT_TIMEOUT)
     rpc_client = rpcclient.create_client(metronome_url, timeout)
 
     logger.info('Creating metronome client with: %r', metronome_url)
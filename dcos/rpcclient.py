@@ -1,3 +1,4 @@
+import functools
 import json
 
 import jsonschema
@@ -26,6 +27,18 @@ def load_error_json_schema():
     return json.loads(schema_bytes.decode('utf-8'))
 
 
+@functools.lru_cache(maxsize=1)
+def _error_json_validator():
+    """Builds the validator for Marathon error responses on first use, so that
+    importing this module doesn't read and compile the schema.
+
+    :returns: validator for the Marathon error response JSON schema
+    :rtype: jsonschema.Draft4Validator
+    """
+
+    return jsonschema.Draft4Validator(load_error_json_schema())
+
+
 class RpcClient(object):
     """Convenience class for making requests against a common RPC API.
 
@@ -45,7 +58,6 @@ class RpcClient(object):
         self._base_url = base_url
         self._timeout = timeout
 
-    ERROR_JSON_VALIDATOR = jsonschema.Draft4Validator(load_error_json_schema())
     RESOURCE_TYPES = ['app', 'group', 'pod']
 
     @classmethod
@@ -89,7 +101,7 @@ class RpcClient(object):
             template = 'Error decoding response from [{}]: HTTP {}: {}'
             return template.format(request_url, status_code, reason)
 
-        if not cls.ERROR_JSON_VALIDATOR.is_valid(json_body):
+        if not _error_json_validator().is_valid(json_body):
             log_str = 'Server did not return a message: %s'
             logger.error(log_str, json_body)
 
@@ -344,10 +344,25 @@ def validate_json(instance, schema):
     :rtype: [str]
     """
 
+    return validate_json_with(instance, jsonschema.Draft4Validator(schema))
+
+
+def validate_json_with(instance, validator):
+    """Validate an instance with an already constructed validator. Use this
+    instead of `validate_json` when validating several instances against
+    the same schema.
+
+    :param instance: the instance to validate
+    :type instance: dict
+    :param validator: the validator to use
+    :type validator: jsonschema.Draft4Validator
+    :returns: list of errors as strings
+    :rtype: [str]
+    """
+
     def sort_key(ve):
         return six.u(_hack_error_message_fix(ve.message))
 
-    validator = jsonschema.Draft4Validator(schema)
     validation_errors = list(validator.iter_errors(instance))
     validation_errors = sorted(validation_errors, key=sort_key)
 
@@ -469,7 +484,7 @@ def parse_int(string):
 
     try:
         return int(string)
-    except:
+    except (ValueError, TypeError):
         logger.error(
             'Unhandled exception while parsing string as int: %r',
             string)
@@ -488,7 +503,7 @@ def parse_float(string):
 
     try:
         return float(string)
-    except:
+    except (ValueError, TypeError):
         logger.error(
             'Unhandled exception while parsing string as float: %r',
             string)
@@ -53,6 +53,21 @@ def test_no_matching_cmd(args):
         cmds.execute(commands, args)
 
 
+def test_stops_checking_hierarchy_at_first_unset_key(args):
+    commands = [
+        cmds.Command(
+            hierarchy=['cmd-c', 'not-an-arg'],
+            arg_keys=['arg-0', 'arg-1', 'arg-2'],
+            function=pytest.fail),
+        cmds.Command(
+            hierarchy=['cmd-a', 'cmd-b'],
+            arg_keys=['arg-0', 'arg-1', 'arg-2'],
+            function=function),
+    ]
+
+    assert cmds.execute(commands, args) == 1
+
+
 def test_similar_cmds(args):
     commands = [
         cmds.Command(
@@ -1,6 +1,8 @@
+import os
+
 import pytest
 
-from dcos import config
+from dcos import config, constants
 
 
 @pytest.fixture
@@ -100,6 +102,38 @@ def test_mutable_iterator(mutable_conf):
     ])
 
 
+def test_get_config_schema_is_cached():
+    schema = config.get_config_schema('marathon')
+    assert schema['properties']['url']
+    assert config.get_config_schema('marathon') is schema
+
+
+def test_get_config_path(monkeypatch):
+    monkeypatch.setitem(os.environ, constants.DCOS_CONFIG_ENV, '/a/dcos.toml')
+    assert config.get_config_path() == '/a/dcos.toml'
+
+    monkeypatch.delitem(os.environ, constants.DCOS_CONFIG_ENV)
+    assert config.get_config_path() == config.get_default_config_path()
+
+
+def test_get_config_is_cached_until_saved(tmpdir, monkeypatch):
+    path = str(tmpdir.join('dcos.toml'))
+    monkeypatch.setitem(os.environ, constants.DCOS_CONFIG_ENV, path)
+    with open(path, 'w') as config_file:
+        config_file.write('[core]\ntimeout = 5\n')
+    os.chmod(path, 0o600)
+
+    toml_config = config.get_config()
+    assert config.get_config() is toml_config
+
+    mutable_config = config.get_config(mutable=True)
+    mutable_config['core.timeout'] = 10
+    config.save(mutable_config)
+
+    assert config.get_config() is not toml_config
+    assert config.get_config()['core.timeout'] == 10
+
+
 def _conf():
     return {
         'dcos': {
@@ -0,0 +1,46 @@
+import concurrent.futures
+import time
+
+import mock
+import requests
+
+from dcos import http
+
+
+def test_session_is_shared():
+    assert http._get_session() is http._get_session()
+
+
+@mock.patch('dcos.http.requests.Session')
+def test_concurrent_first_calls_share_one_session(session_class):
+    def slow_session():
+        time.sleep(0.05)
+        return mock.MagicMock()
+
+    session_class.side_effect = slow_session
+    http._create_session.cache_clear()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(3) as pool:
+            futures = [pool.submit(http._get_session) for _ in range(3)]
+            sessions = [future.result() for future in futures]
+    finally:
+        http._create_session.cache_clear()
+
+    assert session_class.call_count == 1
+    assert sessions[0] is sessions[1] is sessions[2]
+
+
+@mock.patch('dcos.http._get_session')
+def test_request_uses_shared_session(get_session):
+    response = requests.Response()
+    response.status_code = 200
+    get_session.return_value.request.return_value = response
+
+    assert http._request('GET', 'http://localhost/', verify=True) is response
+    get_session.return_value.request.assert_called_once_with(
+        method='GET',
+        url='http://localhost/',
+        timeout=http.DEFAULT_TIMEOUT,
+        auth=None,
+        verify=True,
+        headers={'Accept': 'application/json'})
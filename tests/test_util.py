@@ -1,3 +1,4 @@
+import jsonschema
 import pytest
 
 from dcos import util
@@ -11,3 +12,25 @@ def test_open_file():
             pass
     assert 'Error opening file [{}]: No such file or directory'.format(path) \
         in str(excinfo.value)
+
+
+def test_parse_int():
+    assert util.parse_int('-3') == -3
+    for value in ['2014-01-01T00:00:00Z', None]:
+        with pytest.raises(DCOSException) as excinfo:
+            util.parse_int(value)
+        assert str(excinfo.value) == 'Error parsing string as int'
+
+
+def test_validate_json_with_reused_validator():
+    schema = {
+        'type': 'object',
+        'properties': {'instances': {'type': 'integer'}},
+        'additionalProperties': False
+    }
+    validator = jsonschema.Draft4Validator(schema)
+
+    assert util.validate_json_with({'instances': 1}, validator) == []
+    assert util.validate_json_with({'instances': 'one'}, validator) == \
+        util.validate_json({'instances': 'one'}, schema)
+    assert len(util.validate_json_with({'cmd': 'sleep'}, validator)) == 1